@@ -21,66 +21,359 @@ Usage:
 Requirements:
     - GitHub CLI (gh) must be installed and authenticated
     - YAML configuration file (default: features.yaml)
+    - Optional: requests — enables batched creation via the GraphQL API
+      (falls back to one gh call per issue without it)
 """
 
 import argparse
+import json
+import os
 import subprocess
 import sys
 import yaml
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields as dataclass_fields
+from functools import wraps
 from pathlib import Path
+from string import Template
 from typing import Optional
 
+try:
+    import requests
+except ImportError:
+    # Without requests we fall back to one `gh issue create` per issue.
+    requests = None
+
+GITHUB_API = 'https://api.github.com'
+
+# How many createIssue mutations to pack into one GraphQL request
+ISSUES_PER_REQUEST = 10
+
+# How many batch requests to keep in flight (stays well inside GitHub's
+# secondary rate limits)
+MAX_CONCURRENT_REQUESTS = 10
+
+
+# libyaml's C parser is 3-15x faster than the pure-Python one; fall back
+# gracefully when PyYAML was built without it.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 def load_config(config_path: Path) -> dict:
-    """Load YAML configuration file."""
+    """Load YAML configuration file.
+
+    Parsed output is cached as a JSON sidecar (features.yaml.cache.json)
+    keyed on the YAML's mtime — json.load is much faster than a YAML
+    parse, and this script is re-run often with the same config.
+    """
     if not config_path.exists():
         print(f"Error: Configuration file not found: {config_path}")
         sys.exit(1)
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return yaml.safe_load(f)
+    cache_path = config_path.with_name(config_path.name + '.cache.json')
+    yaml_mtime = config_path.stat().st_mtime_ns
 
+    if cache_path.exists() and cache_path.stat().st_mtime_ns >= yaml_mtime:
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            pass  # corrupt/unreadable cache — fall through to a fresh parse
 
-def create_issue(
-    title: str,
-    body: str,
-    labels: list[str],
-    dry_run: bool = False
-) -> Optional[str]:
-    """Create a GitHub issue using the gh CLI."""
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
 
-    label_args = []
-    for label in labels:
-        label_args.extend(['--label', label])
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(config, f)
+    except (OSError, TypeError):
+        pass  # cache is best-effort; read-only checkouts still work
+
+    return config
+
+
+# The raw YAML dicts are resolved into typed records once, up-front.
+# The body generators then use plain attribute access (C-level, via
+# slots) instead of dozens of dict.get calls with inline defaults per
+# item — and the defaults live in one place.
+class ConfigRecord:
+    """Base for feature records built from raw config dicts."""
+
+    __slots__ = ()
+
+    @classmethod
+    def from_config(cls, data: dict):
+        """Build a record from a config dict, ignoring unknown keys."""
+        known = {f.name for f in dataclass_fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
+
+@dataclass(slots=True)
+class Domain(ConfigRecord):
+    """A domain research entry from features.yaml."""
+    name: str = ''
+    regulator: str = ''
+    jurisdiction: str = 'United States Federal'
+    slug: str = 'domain'
+    categories: list = field(default_factory=list)
+    resources: list = field(default_factory=list)
+    notes: str = ''
+    effort: str = 'Medium'
+    labels: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Industry(ConfigRecord):
+    """An industry research entry from features.yaml."""
+    name: str = ''
+    regulators: list = field(default_factory=list)
+    market_size: str = 'TBD'
+    slug: str = 'industry'
+    claim_types: list = field(default_factory=list)
+    federal_regulations: list = field(default_factory=list)
+    state_regulations: list = field(default_factory=list)
+    self_regulatory: list = field(default_factory=list)
+    compliance_considerations: list = field(default_factory=list)
+    pilot_candidates: list = field(default_factory=list)
+    resources: list = field(default_factory=list)
+    notes: str = ''
+    effort: str = 'Medium'
+    labels: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Agent(ConfigRecord):
+    """An agent specification entry from features.yaml."""
+    name: str = ''
+    type: str = 'Analysis'
+    priority: str = 'Medium'
+    complexity: str = 'Medium'
+    purpose: str = ''
+    input_schema: str = '// Define input schema'
+    output_schema: str = '// Define output schema'
+    required_inputs: list = field(default_factory=list)
+    optional_inputs: list = field(default_factory=list)
+    output_fields: list = field(default_factory=list)
+    capabilities: list = field(default_factory=list)
+    processing_logic: str = ''
+    upstream_agents: list = field(default_factory=lambda: ['None'])
+    downstream_agents: list = field(default_factory=lambda: ['None'])
+    external_services: list = field(default_factory=lambda: ['None'])
+    error_handling: list = field(default_factory=list)
+    latency_target: str = 'TBD'
+    throughput_target: str = 'TBD'
+    accuracy_target: str = 'TBD'
+    prompt_notes: str = ''
+    test_scenarios: list = field(default_factory=list)
+    implementation_notes: str = ''
+    effort: str = 'Medium'
+    related_domain: str = ''
+    labels: list = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class Pilot(ConfigRecord):
+    """A pilot task entry from features.yaml."""
+    name: str = ''
+    industry: str = ''
+    agents: list = field(default_factory=list)
+    source_type: str = ''
+    source_url: str = ''
+    data_volume: str = ''
+    date_range: str = ''
+    in_scope: list = field(default_factory=list)
+    out_of_scope: list = field(default_factory=list)
+    detection_target: str = '>90%'
+    accuracy_target: str = '>85%'
+    time_target: str = '<5s per page'
+    fp_target: str = '<10%'
+    success_criteria: list = field(default_factory=list)
+    notes: str = ''
+    effort: str = 'Medium'
+    prerequisites: list = field(default_factory=list)
+    labels: list = field(default_factory=list)
+
+
+def get_github_token() -> Optional[str]:
+    """Get a GitHub API token from the environment or the gh CLI."""
+    token = os.environ.get('GITHUB_TOKEN')
+    if token:
+        return token
+    try:
+        result = subprocess.run(
+            ['gh', 'auth', 'token'],
+            capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
+        return None
 
-    cmd = ['gh', 'issue', 'create', '--title', title, '--body', body] + label_args
 
-    if dry_run:
-        print(f"\n{'='*60}")
-        print(f"[DRY RUN] Would create issue:")
-        print(f"  Title: {title}")
-        print(f"  Labels: {', '.join(labels)}")
-        print(f"  Body preview (first 500 chars):")
-        print(f"  {body[:500]}...")
+def get_repo_name(config: dict) -> Optional[str]:
+    """Resolve 'owner/repo', from config or the gh CLI's current repo."""
+    repo = (config.get('project') or {}).get('repo')
+    if repo:
+        return repo
+    try:
+        result = subprocess.run(
+            ['gh', 'repo', 'view', '--json', 'nameWithOwner',
+             '-q', '.nameWithOwner'],
+            capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip() or None
+    except (OSError, subprocess.CalledProcessError):
         return None
 
+
+def graphql(session, query: str, variables: dict) -> dict:
+    """POST a GraphQL query and return its data, raising on errors."""
+    resp = session.post(f'{GITHUB_API}/graphql',
+                        json={'query': query, 'variables': variables})
+    resp.raise_for_status()
+    payload = resp.json()
+    if payload.get('errors'):
+        raise RuntimeError(payload['errors'][0].get('message', 'GraphQL error'))
+    return payload['data']
+
+
+def resolve_repository(session, repo_name: str) -> tuple[str, dict]:
+    """Fetch the repository node id and its label name -> id map in one query."""
+    owner, name = repo_name.split('/', 1)
+    data = graphql(session, '''
+        query($owner: String!, $name: String!) {
+          repository(owner: $owner, name: $name) {
+            id
+            labels(first: 100) { nodes { id name } }
+          }
+        }''', {'owner': owner, 'name': name})
+    repo = data['repository']
+    return repo['id'], {n['name']: n['id'] for n in repo['labels']['nodes']}
+
+
+def ensure_labels(session, repo_name: str, label_ids: dict, names: set):
+    """Create any labels missing from label_ids and record their node ids."""
+    for name in sorted(names - label_ids.keys()):
+        resp = session.post(f'{GITHUB_API}/repos/{repo_name}/labels',
+                            json={'name': name, 'color': '0366d6'})
+        if resp.ok:
+            label_ids[name] = resp.json()['node_id']
+        else:
+            print(f"Warning: could not create label '{name}' "
+                  f"(HTTP {resp.status_code})")
+
+
+def create_issues_batch(issues: list[dict], config: dict) -> list[str]:
+    """Create issues via the GraphQL API, batching mutations with aliases.
+
+    One authenticated session resolves the repository id and labels
+    up-front, then packs ISSUES_PER_REQUEST createIssue mutations into
+    each request — instead of one gh subprocess (fork + TLS handshake)
+    per issue. Falls back to the gh CLI when requests or auth is missing.
+    """
+    token = get_github_token()
+    repo_name = get_repo_name(config)
+
+    if requests is None or not token or not repo_name:
+        urls = []
+        for spec in issues:
+            url = create_issue(spec['title'], spec['body'], spec['labels'])
+            if url:
+                urls.append(url)
+        return urls
+
+    session = requests.Session()
+    session.headers['Authorization'] = f'Bearer {token}'
+
+    repo_id, label_ids = resolve_repository(session, repo_name)
+    ensure_labels(session, repo_name, label_ids,
+                  {label for spec in issues for label in spec['labels']})
+
+    batches = []
+    for start in range(0, len(issues), ISSUES_PER_REQUEST):
+        chunk = issues[start:start + ISSUES_PER_REQUEST]
+
+        var_defs = []
+        fields = []
+        variables = {}
+        for i, spec in enumerate(chunk):
+            var_defs.append(f'$input{i}: CreateIssueInput!')
+            fields.append(f'i{i}: createIssue(input: $input{i}) '
+                          '{ issue { url } }')
+            variables[f'input{i}'] = {
+                'repositoryId': repo_id,
+                'title': spec['title'],
+                'body': spec['body'],
+                'labelIds': [label_ids[l] for l in spec['labels']
+                             if l in label_ids],
+            }
+
+        mutation = f"mutation({', '.join(var_defs)}) {{ {' '.join(fields)} }}"
+        batches.append((mutation, variables, len(chunk)))
+
+    def run_batch(batch) -> list[str]:
+        mutation, variables, size = batch
+        try:
+            data = graphql(session, mutation, variables)
+        except (RuntimeError, requests.RequestException) as e:
+            print(f"Error creating issues: {e}")
+            return []
+        return [data[f'i{i}']['issue']['url'] for i in range(size)]
+
+    # Fire the batch requests concurrently; executor.map keeps results in
+    # submission order so the printed URLs match the config order.
+    urls = []
+    workers = min(MAX_CONCURRENT_REQUESTS, len(batches)) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for batch_urls in executor.map(run_batch, batches):
+            for url in batch_urls:
+                print(f"Created: {url}")
+                urls.append(url)
+
+    return urls
+
+
+def create_issue(title: str, body: str, labels: list[str]) -> Optional[str]:
+    """Create a single GitHub issue using the gh CLI (fallback path)."""
+
+    # gh accepts comma-separated labels in a single --label argument
+    cmd = ['gh', 'issue', 'create', '--title', title, '--body', body]
+    if labels:
+        cmd += ['--label', ','.join(labels)]
+
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        issue_url = result.stdout.strip()
+        # Only stdout (the issue URL) matters on success; gh's own stderr
+        # goes straight to the terminal instead of through a second pipe.
+        issue_url = subprocess.check_output(cmd, text=True).strip()
         print(f"Created: {issue_url}")
         return issue_url
     except subprocess.CalledProcessError as e:
-        print(f"Error creating issue '{title}': {e.stderr}")
+        print(f"Error creating issue '{title}' (exit {e.returncode})")
         return None
 
 
-def generate_domain_body(domain: dict) -> str:
-    """Generate issue body for domain research."""
-    return f"""## Domain Overview
+def submit_issues(issues: list[dict], config: dict, dry_run: bool) -> list[str]:
+    """Create (or preview) a batch of issue specs."""
+    if dry_run:
+        for spec in issues:
+            print(f"\n{'='*60}")
+            print(f"[DRY RUN] Would create issue:")
+            print(f"  Title: {spec['title']}")
+            print(f"  Labels: {', '.join(spec['labels'])}")
+            print(f"  Body preview (first 500 chars):")
+            print(f"  {spec['body'][:500]}...")
+        return []
+
+    return create_issues_batch(issues, config)
+
+
+# Issue body templates are compiled once at import time; the generate_*_body
+# functions only fill in per-item values, so the per-issue cost is a single
+# substitution pass instead of rebuilding the template for every item.
+_DOMAIN_BODY = Template("""## Domain Overview
 
-**Domain Name:** {domain.get('name', '')}
-**Regulatory Body:** {domain.get('regulator', '')}
-**Jurisdiction:** {domain.get('jurisdiction', 'United States Federal')}
+**Domain Name:** ${name}
+**Regulatory Body:** ${regulator}
+**Jurisdiction:** ${jurisdiction}
 
 ## Research Objectives
 
@@ -95,7 +388,7 @@ def generate_domain_body(domain: dict) -> str:
 
 | Category | Description | Priority |
 |----------|-------------|----------|
-{generate_table_rows(domain.get('categories', []))}
+${category_rows}
 
 ## Key Questions
 
@@ -107,32 +400,44 @@ def generate_domain_body(domain: dict) -> str:
 
 ## Deliverables
 
-- [ ] `research/domains/{domain.get('slug', 'domain')}/taxonomy.md` - Claim category taxonomy
-- [ ] `research/domains/{domain.get('slug', 'domain')}/guidelines.md` - Regulatory guidelines summary
-- [ ] `research/domains/{domain.get('slug', 'domain')}/enforcement.md` - Enforcement actions review
-- [ ] `research/domains/{domain.get('slug', 'domain')}/patterns.md` - High-risk patterns and keywords
+- [ ] `research/domains/${slug}/taxonomy.md` - Claim category taxonomy
+- [ ] `research/domains/${slug}/guidelines.md` - Regulatory guidelines summary
+- [ ] `research/domains/${slug}/enforcement.md` - Enforcement actions review
+- [ ] `research/domains/${slug}/patterns.md` - High-risk patterns and keywords
 
 ## Resources
 
-{generate_resource_list(domain.get('resources', []))}
+${resources}
 
 ## Notes
 
-{domain.get('notes', '')}
+${notes}
 
 ---
 
-**Estimated Effort:** {domain.get('effort', 'Medium')}
-"""
+**Estimated Effort:** ${effort}
+""")
 
 
-def generate_industry_body(industry: dict) -> str:
-    """Generate issue body for industry research."""
-    return f"""## Industry Overview
+def generate_domain_body(domain: Domain) -> str:
+    """Generate issue body for domain research."""
+    return _DOMAIN_BODY.substitute(
+        name=domain.name,
+        regulator=domain.regulator,
+        jurisdiction=domain.jurisdiction,
+        category_rows=generate_table_rows(domain.categories),
+        slug=domain.slug,
+        resources=generate_resource_list(domain.resources),
+        notes=domain.notes,
+        effort=domain.effort,
+    )
+
 
-**Industry Name:** {industry.get('name', '')}
-**Primary Regulators:** {', '.join(industry.get('regulators', []))}
-**Market Size:** {industry.get('market_size', 'TBD')}
+_INDUSTRY_BODY = Template("""## Industry Overview
+
+**Industry Name:** ${name}
+**Primary Regulators:** ${regulators}
+**Market Size:** ${market_size}
 
 ## Research Objectives
 
@@ -147,143 +452,188 @@ def generate_industry_body(industry: dict) -> str:
 
 | Claim Type | Example | Risk Level | Applicable Regulation |
 |------------|---------|------------|----------------------|
-{generate_claim_type_rows(industry.get('claim_types', []))}
+${claim_type_rows}
 
 ## Regulatory Landscape
 
 ### Federal Regulations
-{generate_bullet_list(industry.get('federal_regulations', []))}
+${federal_regulations}
 
 ### State Regulations
-{generate_bullet_list(industry.get('state_regulations', []))}
+${state_regulations}
 
 ### Self-Regulatory Bodies
-{generate_bullet_list(industry.get('self_regulatory', []))}
+${self_regulatory}
 
 ## Key Compliance Considerations
 
-{generate_numbered_list(industry.get('compliance_considerations', []))}
+${compliance_considerations}
 
 ## Deliverables
 
-- [ ] `research/industries/{industry.get('slug', 'industry')}/overview.md` - Industry compliance overview
-- [ ] `research/industries/{industry.get('slug', 'industry')}/claim-types.md` - Common claim patterns
-- [ ] `research/industries/{industry.get('slug', 'industry')}/regulations.md` - Regulatory requirements
-- [ ] `research/industries/{industry.get('slug', 'industry')}/examples.md` - Compliant/non-compliant examples
+- [ ] `research/industries/${slug}/overview.md` - Industry compliance overview
+- [ ] `research/industries/${slug}/claim-types.md` - Common claim patterns
+- [ ] `research/industries/${slug}/regulations.md` - Regulatory requirements
+- [ ] `research/industries/${slug}/examples.md` - Compliant/non-compliant examples
 
 ## Pilot Candidates
 
 | Company/Product | Reason | Priority |
 |-----------------|--------|----------|
-{generate_pilot_rows(industry.get('pilot_candidates', []))}
+${pilot_rows}
 
 ## Resources
 
-{generate_resource_list(industry.get('resources', []))}
+${resources}
 
 ## Notes
 
-{industry.get('notes', '')}
+${notes}
 
 ---
 
-**Estimated Effort:** {industry.get('effort', 'Medium')}
-"""
+**Estimated Effort:** ${effort}
+""")
 
 
-def generate_agent_spec_body(agent: dict) -> str:
-    """Generate issue body for agent specification."""
-    return f"""## Agent Overview
+def generate_industry_body(industry: Industry) -> str:
+    """Generate issue body for industry research."""
+    return _INDUSTRY_BODY.substitute(
+        name=industry.name,
+        regulators=', '.join(industry.regulators),
+        market_size=industry.market_size,
+        claim_type_rows=generate_claim_type_rows(industry.claim_types),
+        federal_regulations=generate_bullet_list(industry.federal_regulations),
+        state_regulations=generate_bullet_list(industry.state_regulations),
+        self_regulatory=generate_bullet_list(industry.self_regulatory),
+        compliance_considerations=generate_numbered_list(industry.compliance_considerations),
+        slug=industry.slug,
+        pilot_rows=generate_pilot_rows(industry.pilot_candidates),
+        resources=generate_resource_list(industry.resources),
+        notes=industry.notes,
+        effort=industry.effort,
+    )
+
+
+_AGENT_SPEC_BODY = Template("""## Agent Overview
 
-**Agent Name:** {agent.get('name', '')}
-**Agent Type:** {agent.get('type', 'Analysis')}
-**Priority:** {agent.get('priority', 'Medium')}
-**Complexity:** {agent.get('complexity', 'Medium')}
+**Agent Name:** ${name}
+**Agent Type:** ${type}
+**Priority:** ${priority}
+**Complexity:** ${complexity}
 
 ## Purpose & Responsibilities
 
-{agent.get('purpose', '')}
+${purpose}
 
 ## Input Contract
 
 ```typescript
-{agent.get('input_schema', '// Define input schema')}
+${input_schema}
 ```
 
 ### Required Fields
-{generate_bullet_list(agent.get('required_inputs', []))}
+${required_inputs}
 
 ### Optional Fields
-{generate_bullet_list(agent.get('optional_inputs', []))}
+${optional_inputs}
 
 ## Output Contract
 
 ```typescript
-{agent.get('output_schema', '// Define output schema')}
+${output_schema}
 ```
 
 ### Output Fields
-{generate_bullet_list(agent.get('output_fields', []))}
+${output_fields}
 
 ## Core Capabilities
 
-{generate_numbered_list(agent.get('capabilities', []))}
+${capabilities}
 
 ## Processing Logic
 
-{agent.get('processing_logic', '')}
+${processing_logic}
 
 ## Dependencies
 
 ### Upstream Agents
-{generate_bullet_list(agent.get('upstream_agents', ['None']))}
+${upstream_agents}
 
 ### Downstream Agents
-{generate_bullet_list(agent.get('downstream_agents', ['None']))}
+${downstream_agents}
 
 ### External Services
-{generate_bullet_list(agent.get('external_services', ['None']))}
+${external_services}
 
 ## Error Handling
 
 | Error Type | Handling Strategy |
 |------------|------------------|
-{generate_error_handling_rows(agent.get('error_handling', []))}
+${error_rows}
 
 ## Performance Requirements
 
 | Metric | Target |
 |--------|--------|
-| Latency (p95) | {agent.get('latency_target', 'TBD')} |
-| Throughput | {agent.get('throughput_target', 'TBD')} |
-| Accuracy | {agent.get('accuracy_target', 'TBD')} |
+| Latency (p95) | ${latency_target} |
+| Throughput | ${throughput_target} |
+| Accuracy | ${accuracy_target} |
 
 ## Prompt Engineering Notes
 
-{agent.get('prompt_notes', '')}
+${prompt_notes}
 
 ## Test Scenarios
 
-{generate_numbered_list(agent.get('test_scenarios', []))}
+${test_scenarios}
 
 ## Implementation Notes
 
-{agent.get('implementation_notes', '')}
+${implementation_notes}
 
 ---
 
-**Estimated Effort:** {agent.get('effort', 'Medium')}
-**Related Domain:** {agent.get('related_domain', '')}
-"""
+**Estimated Effort:** ${effort}
+**Related Domain:** ${related_domain}
+""")
 
 
-def generate_pilot_body(pilot: dict) -> str:
-    """Generate issue body for pilot task."""
-    return f"""## Pilot Overview
+def generate_agent_spec_body(agent: Agent) -> str:
+    """Generate issue body for agent specification."""
+    return _AGENT_SPEC_BODY.substitute(
+        name=agent.name,
+        type=agent.type,
+        priority=agent.priority,
+        complexity=agent.complexity,
+        purpose=agent.purpose,
+        input_schema=agent.input_schema,
+        required_inputs=generate_bullet_list(agent.required_inputs),
+        optional_inputs=generate_bullet_list(agent.optional_inputs),
+        output_schema=agent.output_schema,
+        output_fields=generate_bullet_list(agent.output_fields),
+        capabilities=generate_numbered_list(agent.capabilities),
+        processing_logic=agent.processing_logic,
+        upstream_agents=generate_bullet_list(agent.upstream_agents),
+        downstream_agents=generate_bullet_list(agent.downstream_agents),
+        external_services=generate_bullet_list(agent.external_services),
+        error_rows=generate_error_handling_rows(agent.error_handling),
+        latency_target=agent.latency_target,
+        throughput_target=agent.throughput_target,
+        accuracy_target=agent.accuracy_target,
+        prompt_notes=agent.prompt_notes,
+        test_scenarios=generate_numbered_list(agent.test_scenarios),
+        implementation_notes=agent.implementation_notes,
+        effort=agent.effort,
+        related_domain=agent.related_domain,
+    )
+
+
+_PILOT_BODY = Template("""## Pilot Overview
 
-**Pilot Name:** {pilot.get('name', '')}
-**Target Industry:** {pilot.get('industry', '')}
-**Agent(s) Being Tested:** {', '.join(pilot.get('agents', []))}
+**Pilot Name:** ${name}
+**Target Industry:** ${industry}
+**Agent(s) Being Tested:** ${agents}
 
 ## Pilot Objectives
 
@@ -295,196 +645,230 @@ def generate_pilot_body(pilot: dict) -> str:
 
 ## Target Data Source
 
-**Source Type:** {pilot.get('source_type', '')}
-**Source URL/Location:** {pilot.get('source_url', '')}
-**Data Volume:** {pilot.get('data_volume', '')}
-**Date Range:** {pilot.get('date_range', '')}
+**Source Type:** ${source_type}
+**Source URL/Location:** ${source_url}
+**Data Volume:** ${data_volume}
+**Date Range:** ${date_range}
 
 ## Scope Definition
 
 ### In Scope
-{generate_bullet_list(pilot.get('in_scope', []))}
+${in_scope}
 
 ### Out of Scope
-{generate_bullet_list(pilot.get('out_of_scope', []))}
+${out_of_scope}
 
 ## Expected Outcomes
 
 ### Quantitative Targets
 | Metric | Target |
 |--------|--------|
-| Claim Detection Rate | {pilot.get('detection_target', '>90%')} |
-| Classification Accuracy | {pilot.get('accuracy_target', '>85%')} |
-| Processing Time | {pilot.get('time_target', '<5s per page')} |
-| False Positive Rate | {pilot.get('fp_target', '<10%')} |
+| Claim Detection Rate | ${detection_target} |
+| Classification Accuracy | ${accuracy_target} |
+| Processing Time | ${time_target} |
+| False Positive Rate | ${fp_target} |
 
 ## Success Criteria
 
 ### Required for Pass
-{generate_bullet_list(pilot.get('success_criteria', []))}
+${success_criteria}
 
 ## Notes
 
-{pilot.get('notes', '')}
+${notes}
 
 ---
 
-**Estimated Effort:** {pilot.get('effort', 'Medium')}
-**Prerequisites:** {', '.join(pilot.get('prerequisites', []))}
-"""
+**Estimated Effort:** ${effort}
+**Prerequisites:** ${prerequisites}
+""")
+
+
+def generate_pilot_body(pilot: Pilot) -> str:
+    """Generate issue body for pilot task."""
+    return _PILOT_BODY.substitute(
+        name=pilot.name,
+        industry=pilot.industry,
+        agents=', '.join(pilot.agents),
+        source_type=pilot.source_type,
+        source_url=pilot.source_url,
+        data_volume=pilot.data_volume,
+        date_range=pilot.date_range,
+        in_scope=generate_bullet_list(pilot.in_scope),
+        out_of_scope=generate_bullet_list(pilot.out_of_scope),
+        detection_target=pilot.detection_target,
+        accuracy_target=pilot.accuracy_target,
+        time_target=pilot.time_target,
+        fp_target=pilot.fp_target,
+        success_criteria=generate_bullet_list(pilot.success_criteria),
+        notes=pilot.notes,
+        effort=pilot.effort,
+        prerequisites=', '.join(pilot.prerequisites),
+    )
 
 
-# Helper functions for generating markdown content
+def memoize_block(fn):
+    """Memoize a markdown helper on a hashable snapshot of its items.
+
+    Config entries often share identical sub-lists (same resources,
+    claim_types, ...) across items; caching returns the prebuilt block
+    instead of re-rendering it. lru_cache can't key on lists, so the
+    list is snapshotted into nested tuples; anything unhashable just
+    renders directly.
+    """
+    cache = {}
+
+    @wraps(fn)
+    def wrapper(items: list) -> str:
+        try:
+            key = tuple(
+                tuple(sorted(item.items())) if isinstance(item, dict) else item
+                for item in items
+            )
+            result = cache.get(key)
+        except TypeError:
+            return fn(items)
+        if result is None:
+            result = cache[key] = fn(items)
+        return result
+
+    return wrapper
+
+
+# Helper functions for generating markdown content.
+# Each one builds its block in a single join over a generator — no
+# intermediate row lists, one allocation per block.
+@memoize_block
 def generate_table_rows(items: list) -> str:
     if not items:
         return "| TBD | TBD | TBD |"
-    rows = []
-    for item in items:
-        if isinstance(item, dict):
-            rows.append(f"| {item.get('name', '')} | {item.get('description', '')} | {item.get('priority', 'Medium')} |")
-        else:
-            rows.append(f"| {item} | TBD | Medium |")
-    return '\n'.join(rows)
+    return '\n'.join(
+        f"| {item.get('name', '')} | {item.get('description', '')} | {item.get('priority', 'Medium')} |"
+        if isinstance(item, dict) else f"| {item} | TBD | Medium |"
+        for item in items
+    )
 
 
+@memoize_block
 def generate_claim_type_rows(items: list) -> str:
     if not items:
         return "| TBD | TBD | TBD | TBD |"
-    rows = []
-    for item in items:
-        if isinstance(item, dict):
-            rows.append(f"| {item.get('type', '')} | {item.get('example', '')} | {item.get('risk', 'Medium')} | {item.get('regulation', '')} |")
-        else:
-            rows.append(f"| {item} | TBD | Medium | TBD |")
-    return '\n'.join(rows)
+    return '\n'.join(
+        f"| {item.get('type', '')} | {item.get('example', '')} | {item.get('risk', 'Medium')} | {item.get('regulation', '')} |"
+        if isinstance(item, dict) else f"| {item} | TBD | Medium | TBD |"
+        for item in items
+    )
 
 
+@memoize_block
 def generate_pilot_rows(items: list) -> str:
     if not items:
         return "| TBD | TBD | TBD |"
-    rows = []
-    for item in items:
-        if isinstance(item, dict):
-            rows.append(f"| {item.get('name', '')} | {item.get('reason', '')} | {item.get('priority', 'Medium')} |")
-        else:
-            rows.append(f"| {item} | TBD | Medium |")
-    return '\n'.join(rows)
+    return '\n'.join(
+        f"| {item.get('name', '')} | {item.get('reason', '')} | {item.get('priority', 'Medium')} |"
+        if isinstance(item, dict) else f"| {item} | TBD | Medium |"
+        for item in items
+    )
 
 
+@memoize_block
 def generate_error_handling_rows(items: list) -> str:
     if not items:
         return "| TBD | TBD |"
-    rows = []
-    for item in items:
-        if isinstance(item, dict):
-            rows.append(f"| {item.get('error', '')} | {item.get('strategy', '')} |")
-        else:
-            rows.append(f"| {item} | TBD |")
-    return '\n'.join(rows)
+    return '\n'.join(
+        f"| {item.get('error', '')} | {item.get('strategy', '')} |"
+        if isinstance(item, dict) else f"| {item} | TBD |"
+        for item in items
+    )
 
 
+@memoize_block
 def generate_bullet_list(items: list) -> str:
     if not items:
         return "- TBD"
     return '\n'.join(f"- {item}" for item in items)
 
 
+@memoize_block
 def generate_numbered_list(items: list) -> str:
     if not items:
         return "1. TBD"
     return '\n'.join(f"{i+1}. {item}" for i, item in enumerate(items))
 
 
+@memoize_block
 def generate_resource_list(items: list) -> str:
     if not items:
         return "- TBD"
-    lines = []
-    for item in items:
-        if isinstance(item, dict):
-            lines.append(f"- [{item.get('title', 'Link')}]({item.get('url', '#')})")
-        else:
-            lines.append(f"- {item}")
-    return '\n'.join(lines)
+    return '\n'.join(
+        f"- [{item.get('title', 'Link')}]({item.get('url', '#')})"
+        if isinstance(item, dict) else f"- {item}"
+        for item in items
+    )
 
 
 def create_domain_issues(config: dict, dry_run: bool = False) -> list[str]:
     """Create issues for all configured domains."""
-    urls = []
-    domains = config.get('domains', [])
+    domains = [Domain.from_config(d) for d in config.get('domains', [])]
 
     print(f"\n{'='*60}")
     print(f"Creating {len(domains)} domain research issue(s)...")
 
-    for domain in domains:
-        title = f"[Research] Domain: {domain.get('name', 'Unknown')}"
-        body = generate_domain_body(domain)
-        labels = ['research', 'domain'] + domain.get('labels', [])
+    issues = [{
+        'title': f"[Research] Domain: {domain.name or 'Unknown'}",
+        'body': generate_domain_body(domain),
+        'labels': ['research', 'domain'] + domain.labels,
+    } for domain in domains]
 
-        url = create_issue(title, body, labels, dry_run)
-        if url:
-            urls.append(url)
-
-    return urls
+    return submit_issues(issues, config, dry_run)
 
 
 def create_industry_issues(config: dict, dry_run: bool = False) -> list[str]:
     """Create issues for all configured industries."""
-    urls = []
-    industries = config.get('industries', [])
+    industries = [Industry.from_config(d) for d in config.get('industries', [])]
 
     print(f"\n{'='*60}")
     print(f"Creating {len(industries)} industry research issue(s)...")
 
-    for industry in industries:
-        title = f"[Research] Industry: {industry.get('name', 'Unknown')}"
-        body = generate_industry_body(industry)
-        labels = ['research', 'industry'] + industry.get('labels', [])
-
-        url = create_issue(title, body, labels, dry_run)
-        if url:
-            urls.append(url)
+    issues = [{
+        'title': f"[Research] Industry: {industry.name or 'Unknown'}",
+        'body': generate_industry_body(industry),
+        'labels': ['research', 'industry'] + industry.labels,
+    } for industry in industries]
 
-    return urls
+    return submit_issues(issues, config, dry_run)
 
 
 def create_agent_issues(config: dict, dry_run: bool = False) -> list[str]:
     """Create issues for all configured agents."""
-    urls = []
-    agents = config.get('agents', [])
+    agents = [Agent.from_config(d) for d in config.get('agents', [])]
 
     print(f"\n{'='*60}")
     print(f"Creating {len(agents)} agent specification issue(s)...")
 
-    for agent in agents:
-        title = f"[Agent] Spec: {agent.get('name', 'Unknown')}"
-        body = generate_agent_spec_body(agent)
-        labels = ['agent', 'specification'] + agent.get('labels', [])
+    issues = [{
+        'title': f"[Agent] Spec: {agent.name or 'Unknown'}",
+        'body': generate_agent_spec_body(agent),
+        'labels': ['agent', 'specification'] + agent.labels,
+    } for agent in agents]
 
-        url = create_issue(title, body, labels, dry_run)
-        if url:
-            urls.append(url)
-
-    return urls
+    return submit_issues(issues, config, dry_run)
 
 
 def create_pilot_issues(config: dict, dry_run: bool = False) -> list[str]:
     """Create issues for all configured pilots."""
-    urls = []
-    pilots = config.get('pilots', [])
+    pilots = [Pilot.from_config(d) for d in config.get('pilots', [])]
 
     print(f"\n{'='*60}")
     print(f"Creating {len(pilots)} pilot task issue(s)...")
 
-    for pilot in pilots:
-        title = f"[Pilot] {pilot.get('name', 'Unknown')}"
-        body = generate_pilot_body(pilot)
-        labels = ['pilot', 'testing'] + pilot.get('labels', [])
+    issues = [{
+        'title': f"[Pilot] {pilot.name or 'Unknown'}",
+        'body': generate_pilot_body(pilot),
+        'labels': ['pilot', 'testing'] + pilot.labels,
+    } for pilot in pilots]
 
-        url = create_issue(title, body, labels, dry_run)
-        if url:
-            urls.append(url)
-
-    return urls
+    return submit_issues(issues, config, dry_run)
 
 
 def main():
@@ -17,6 +17,7 @@ Usage:
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
@@ -32,82 +33,118 @@ OUTPUT_DIR = Path(__file__).parent / "generated"
 # ============================================
 
 def get_prompt_files():
-    """Get all prompt markdown files."""
-    if not PROMPTS_DIR.exists():
-        return []
-    
-    files = []
-    for f in sorted(PROMPTS_DIR.glob("*.md")):
+    """Get all prompt markdown files, indexed by type and phase.
+
+    The index is built in one directory pass so each filter afterwards is
+    a dict lookup instead of a rescan of the prompt list.
+    """
+    index = {"all": [], "by_type": {}, "by_phase": {}}
+
+    # os.scandir reuses the dirent type from the directory read, so no
+    # per-entry stat is needed the way Path.glob does it. Paths stay
+    # plain strings until a file is actually read. Directory order is
+    # kept as-is here; consumers sort the (usually much smaller)
+    # filtered list themselves.
+    try:
+        with os.scandir(PROMPTS_DIR) as entries:
+            files = [e for e in entries
+                     if e.name.endswith(".md") and e.is_file(follow_symlinks=False)]
+    except FileNotFoundError:
+        return index
+
+    for f in files:
         # Extract ID from filename (e.g., R.1.1.md -> R.1.1)
-        prompt_id = f.stem
-        files.append({
+        prompt_id = f.name[:-3]
+        parts = prompt_id.split(".")
+        prompt = {
             "id": prompt_id,
-            "path": f,
-            "type": prompt_id.split(".")[0] if "." in prompt_id else prompt_id[0],
-        })
-    return files
+            "path": f.path,
+            # Stored uppercased so type filters are a plain set lookup
+            "type": (parts[0] if len(parts) > 1 else prompt_id[0]).upper(),
+        }
+        index["all"].append(prompt)
+        index["by_type"].setdefault(prompt["type"], []).append(prompt)
+        # Phase is the second ID segment (R.1.2 -> phase 1)
+        if len(parts) > 1 and parts[1].isdigit():
+            index["by_phase"].setdefault(int(parts[1]), []).append(prompt)
+
+    return index
 
 
-def filter_prompts(prompts, types=None, ids=None, phase=None):
+def filter_prompts(index, types=None, ids=None, phase=None):
     """Filter prompts by type, specific IDs, or phase."""
-    filtered = prompts
-    
-    if ids:
-        id_list = [i.strip() for i in ids.split(",")]
-        filtered = [p for p in filtered if p["id"] in id_list]
-    
     if types:
-        type_list = [t.strip().upper() for t in types.split(",")]
-        filtered = [p for p in filtered if p["type"].upper() in type_list]
-    
-    if phase is not None:
-        # Filter by phase number in ID (e.g., R.1.x = phase 1)
-        filtered = [p for p in filtered if f".{phase}." in p["id"] or p["id"].startswith(f"{p['type']}.{phase}")]
-    
-    return filtered
+        type_set = frozenset(t.strip().upper() for t in types.split(","))
+        filtered = [p
+                    for t, prompts in index["by_type"].items()
+                    if t in type_set
+                    for p in prompts]
+    else:
+        filtered = index["all"]
 
+    if ids:
+        id_set = frozenset(i.strip() for i in ids.split(","))
+        filtered = [p for p in filtered if p["id"] in id_set]
 
-def combine_prompts(prompts, include_separator=True):
-    """Combine multiple prompt files into one."""
-    combined = []
-    
-    combined.append(f"# Combined Prompts")
-    combined.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-    combined.append(f"Total prompts: {len(prompts)}")
-    combined.append("")
-    combined.append("## Prompts Included")
+    if phase is not None:
+        # Exact match on the phase segment — a substring test would also
+        # catch IDs like R.10.1 when filtering for phase 1.
+        phase_ids = {p["id"] for p in index["by_phase"].get(phase, [])}
+        filtered = [p for p in filtered if p["id"] in phase_ids]
+
+    # One sort on the filtered result, rather than sorting the whole
+    # directory listing up-front.
+    return sorted(filtered, key=lambda p: p["id"])
+
+
+def combine_prompts(prompts, include_separator=True, deterministic=False):
+    """Yield the combined prompt document line by line.
+
+    Streaming the lines straight to the output keeps peak memory around
+    one prompt's content instead of the full combined document plus a
+    joined copy of it.
+
+    With deterministic=True the timestamp header is skipped, so the
+    output is byte-identical across runs for the same prompt set —
+    downstream tooling can hash/cmp it and short-circuit when nothing
+    changed.
+    """
+    yield "# Combined Prompts"
+    if not deterministic:
+        yield f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+    yield f"Total prompts: {len(prompts)}"
+    yield ""
+    yield "## Prompts Included"
     for p in prompts:
-        combined.append(f"- {p['id']}")
-    combined.append("")
-    combined.append("---")
-    combined.append("")
-    
-    for i, prompt in enumerate(prompts):
-        content = prompt["path"].read_text(encoding="utf-8")
-        
-        if include_separator and i > 0:
-            combined.append("")
-            combined.append("---")
-            combined.append("")
-        
-        combined.append(f"<!-- PROMPT: {prompt['id']} -->")
-        combined.append("")
-        combined.append(content)
-    
-    return "\n".join(combined)
+        yield f"- {p['id']}"
+    yield ""
+    yield "---"
+    yield ""
+
+    def read_prompt(p):
+        with open(p["path"], encoding="utf-8") as f:
+            return f.read()
+
+    # Read the files concurrently so the OS can overlap the open/read
+    # syscalls — the combine step below still runs in prompt order.
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        contents = executor.map(read_prompt, prompts)
 
+        for i, (prompt, content) in enumerate(zip(prompts, contents)):
+            if include_separator and i > 0:
+                yield ""
+                yield "---"
+                yield ""
 
-def list_prompts(prompts):
+            yield f"<!-- PROMPT: {prompt['id']} -->"
+            yield ""
+            yield content
+
+
+def list_prompts(index):
     """Print list of available prompts."""
     print("\n📋 Available Prompts\n")
-    
-    by_type = {}
-    for p in prompts:
-        t = p["type"]
-        if t not in by_type:
-            by_type[t] = []
-        by_type[t].append(p)
-    
+
     type_names = {
         "R": "Research",
         "S": "Specs",
@@ -120,10 +157,10 @@ def list_prompts(prompts):
         "5": "Phase 5",
     }
     
-    for t, items in sorted(by_type.items()):
+    for t, items in sorted(index["by_type"].items()):
         name = type_names.get(t, t)
         print(f"  {name} ({t}.x.x)")
-        for p in items:
+        for p in sorted(items, key=lambda p: p["id"]):
             print(f"    • {p['id']}")
         print()
 
@@ -136,23 +173,25 @@ def main():
     parser.add_argument("--output", "-o", help="Output filename")
     parser.add_argument("--list", "-l", action="store_true", help="List available prompts")
     parser.add_argument("--stdout", action="store_true", help="Print to stdout instead of file")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="Omit the timestamp so output is byte-identical across runs")
     args = parser.parse_args()
     
     # Get all prompts
-    prompts = get_prompt_files()
-    
-    if not prompts:
+    index = get_prompt_files()
+
+    if not index["all"]:
         print("❌ No prompts found in prompts/ directory")
         sys.exit(1)
-    
+
     # List mode
     if args.list:
-        list_prompts(prompts)
+        list_prompts(index)
         return
-    
+
     # Filter prompts
     filtered = filter_prompts(
-        prompts,
+        index,
         types=args.type,
         ids=args.ids,
         phase=args.phase
@@ -163,15 +202,15 @@ def main():
         print("\nUse --list to see available prompts")
         sys.exit(1)
     
-    # Combine prompts
-    combined = combine_prompts(filtered)
-    
+    # Combine prompts — a lazy line generator, written as it is produced
+    lines = combine_prompts(filtered, deterministic=args.deterministic)
+
     # Output
     if args.stdout:
-        print(combined)
+        sys.stdout.writelines(f"{line}\n" for line in lines)
     else:
         OUTPUT_DIR.mkdir(exist_ok=True)
-        
+
         # Generate output filename
         if args.output:
             output_file = OUTPUT_DIR / args.output
@@ -185,8 +224,18 @@ def main():
             else:
                 suffix = "all"
             output_file = OUTPUT_DIR / f"prompts-{suffix}.md"
-        
-        output_file.write_text(combined, encoding="utf-8")
+
+        # Stream into a temp file and swap it onto the target with
+        # os.replace, so a read error mid-stream can't leave a
+        # truncated file behind (or clobber a previous good output).
+        tmp_file = output_file.with_name(output_file.name + ".tmp")
+        try:
+            with open(tmp_file, "w", encoding="utf-8") as fh:
+                fh.writelines(f"{line}\n" for line in lines)
+            os.replace(tmp_file, output_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
         print(f"✅ Generated: {output_file}")
         print(f"   Prompts: {len(filtered)}")
         print(f"\nIncluded:")
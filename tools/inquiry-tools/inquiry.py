@@ -16,19 +16,24 @@ Setup:
     4. Run: python inquiry.py setup-labels
 """
 
+import io
+import json
 import os
 import sys
-import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-import yaml
+# yaml, PyGithub and subprocess are imported lazily (in load_features /
+# get_github / the commands that shell out): frequent commands like
+# `list` shouldn't pay their import cost on every invocation.
 
+# orjson parses/serializes the JSON sidecar cache a few times faster
+# than the stdlib; entirely optional
 try:
-    from github import Github
+    import orjson
 except ImportError:
-    print("PyGithub not installed. Run: pip install PyGithub")
-    sys.exit(1)
+    orjson = None
 
 
 # ============================================
@@ -37,18 +42,87 @@ except ImportError:
 
 TOOLS_DIR = Path(__file__).parent
 FEATURES_FILE = TOOLS_DIR / "features.yaml"
+FEATURES_CACHE = TOOLS_DIR / "features.yaml.cache.json"  # mtime-keyed parse cache
 PROMPTS_DIR = TOOLS_DIR / "prompts"
 CURRENT_FILE = TOOLS_DIR / ".current"  # Tracks current feature
 
 
 def load_features() -> dict:
-    """Load features from YAML file"""
+    """Load features from YAML file.
+
+    Cached at two levels: in-process via lru_cache keyed on the YAML's
+    (mtime, size), so repeated calls across command dispatch are a dict
+    hit; and on disk as a JSON sidecar keyed on the YAML's mtime, so
+    fresh processes skip the YAML parse too.
+    """
+    stat = FEATURES_FILE.stat()
+    return _load_features_cached(stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=1)
+def _load_features_cached(yaml_mtime: int, size: int) -> dict:
+    # The arguments only serve as the cache key; a changed config file
+    # gets a new (mtime, size) pair and falls through to a re-read.
+    if FEATURES_CACHE.exists() and FEATURES_CACHE.stat().st_mtime_ns >= yaml_mtime:
+        try:
+            raw = FEATURES_CACHE.read_bytes()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except (OSError, ValueError):
+            pass  # corrupt/unreadable cache — fall through to a fresh parse
+
+    import yaml
+
     with open(FEATURES_FILE) as f:
-        return yaml.safe_load(f)
+        # Prefer libyaml's C parser when PyYAML was built against it
+        config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
+    try:
+        if orjson is not None:
+            FEATURES_CACHE.write_bytes(orjson.dumps(config))
+        else:
+            with open(FEATURES_CACHE, "w") as f:
+                json.dump(config, f)
+    except (OSError, TypeError):
+        pass  # cache is best-effort
+
+    return config
+
+
+@lru_cache(maxsize=1)
+def _phase_index(yaml_mtime: int, size: int) -> dict:
+    # Feature ids grouped by their phase label, in file order. Shares
+    # the (mtime, size) key with _load_features_cached so it invalidates
+    # together with the config.
+    index = {}
+    for fid, feature in _load_features_cached(yaml_mtime, size)["features"].items():
+        index.setdefault(feature.get("phase", ""), []).append(fid)
+    return index
+
+
+def features_by_phase(phase: str) -> list:
+    """Feature ids for one phase, via the cached index."""
+    stat = FEATURES_FILE.stat()
+    return _phase_index(stat.st_mtime_ns, stat.st_size).get(f"phase:{phase}", [])
+
+
+# Cached (client, repo) pair — PyGithub keeps one requests.Session per
+# client, so reusing it preserves HTTP keepalive across API calls in
+# the same run instead of re-handshaking per command step.
+_GITHUB: Optional[tuple] = None
 
 
 def get_github() -> tuple:
-    """Get GitHub client and repo"""
+    """Get GitHub client and repo (cached per process)"""
+    global _GITHUB
+    if _GITHUB is not None:
+        return _GITHUB
+
+    try:
+        from github import Github
+    except ImportError:
+        print("PyGithub not installed. Run: pip install PyGithub")
+        sys.exit(1)
+
     token = os.environ.get("GITHUB_TOKEN")
     if not token:
         print("❌ GITHUB_TOKEN environment variable not set")
@@ -70,29 +144,107 @@ def get_github() -> tuple:
     except Exception as e:
         print(f"❌ Could not access repo '{repo_name}': {e}")
         sys.exit(1)
-    
-    return g, repo
+
+    _GITHUB = (g, repo)
+    return _GITHUB
 
 
+# Label names known to exist in the repo, fetched at most once per process
+_LABEL_CACHE: Optional[set] = None
+
+
+def _fetch_labels(repo) -> Optional[dict]:
+    """Fetch all labels as {name: {color, description}} in one GraphQL query.
+
+    A single round-trip instead of REST pagination; returns None when
+    GraphQL isn't available (caller falls back to repo.get_labels()).
+    """
+    query = """
+        query($owner: String!, $name: String!) {
+          repository(owner: $owner, name: $name) {
+            labels(first: 100) {
+              nodes { name color description }
+            }
+          }
+        }"""
+    owner, name = repo.full_name.split("/", 1)
+    try:
+        _, data = repo._requester.requestJsonAndCheck(
+            "POST", "/graphql",
+            input={"query": query, "variables": {"owner": owner, "name": name}},
+        )
+        nodes = data["data"]["repository"]["labels"]["nodes"]
+    except Exception:
+        return None
+    return {
+        node["name"]: {
+            "color": node["color"],
+            "description": node["description"] or "",
+        }
+        for node in nodes
+    }
+
+
+def _ensure_labels(repo, names: list) -> list:
+    """Return the label names that exist, creating missing ones.
+
+    The repo's full label set is fetched once and cached, replacing the
+    old get_label/create_label round-trip per label on every start.
+    """
+    global _LABEL_CACHE
+    if _LABEL_CACHE is None:
+        labels = _fetch_labels(repo)
+        if labels is not None:
+            _LABEL_CACHE = set(labels)
+        else:
+            _LABEL_CACHE = {label.name for label in repo.get_labels()}
+
+    for name in names:
+        if name not in _LABEL_CACHE:
+            try:
+                repo.create_label(name, "0366d6")
+            except Exception:
+                continue  # no permission, or created concurrently
+            _LABEL_CACHE.add(name)
+
+    return [name for name in names if name in _LABEL_CACHE]
+
+
+@lru_cache(maxsize=1)
 def get_current_feature() -> Optional[tuple]:
-    """Get currently active feature (id, issue_number)"""
-    if CURRENT_FILE.exists():
+    """Get currently active feature (id, issue_number, node_id).
+
+    Commands call this several times per run; the result is cached and
+    the setters below invalidate it, so the .current file is read (and
+    stat'ed) once per process. The open itself doubles as the existence
+    check.
+    """
+    try:
         content = CURRENT_FILE.read_text().strip()
-        if ":" in content:
-            feature_id, issue_num = content.split(":")
-            return feature_id, int(issue_num)
+    except FileNotFoundError:
+        return None
+    parts = content.split(":")
+    if len(parts) >= 2:
+        # Third segment (the issue's GraphQL node id) is optional so old
+        # .current files keep working.
+        return parts[0], int(parts[1]), parts[2] if len(parts) > 2 else None
     return None
 
 
-def set_current_feature(feature_id: str, issue_number: int):
+def set_current_feature(feature_id: str, issue_number: int, node_id: Optional[str] = None):
     """Set currently active feature"""
-    CURRENT_FILE.write_text(f"{feature_id}:{issue_number}")
+    record = f"{feature_id}:{issue_number}"
+    if node_id:
+        record += f":{node_id}"
+    CURRENT_FILE.write_text(record)
+    get_current_feature.cache_clear()
 
 
 def clear_current_feature():
     """Clear currently active feature"""
     if CURRENT_FILE.exists():
         CURRENT_FILE.unlink()
+    get_current_feature.cache_clear()
 
 
 # ============================================
@@ -104,28 +256,38 @@ def cmd_list(phase: Optional[str] = None):
     config = load_features()
     features = config["features"]
     
-    print("\n📋 INQUIRY FRAMEWORK FEATURES\n")
-    print(f"{'ID':<8} {'Title':<50} {'Size':<12} {'Phase'}")
-    print("-" * 90)
-    
     current = get_current_feature()
     current_id = current[0] if current else None
-    
-    for fid, feature in features.items():
-        # Filter by phase if specified
-        if phase and feature.get("phase") != f"phase:{phase}":
-            continue
-        
+
+    # Build the table in memory and write it in one syscall — per-row
+    # print() flushes line by line, which dominates for long lists.
+    lines = [
+        "\n📋 INQUIRY FRAMEWORK FEATURES\n",
+        f"{'ID':<8} {'Title':<50} {'Size':<12} {'Phase'}",
+        "-" * 90,
+    ]
+
+    # Phase filtering walks the cached phase index rather than testing
+    # every feature's label in the loop
+    if phase:
+        items = ((fid, features[fid]) for fid in features_by_phase(phase))
+    else:
+        items = features.items()
+
+    for fid, feature in items:
         marker = "→ " if fid == current_id else "  "
-        size = feature.get("size", "").replace("size:", "")
+        size = feature.get("size", "")
+        if size.startswith("size:"):
+            size = size[5:]
         phase_num = feature.get("phase", "").replace("phase:", "").split("-")[0]
-        
-        print(f"{marker}{fid:<6} {feature['title']:<50} {size:<12} {phase_num}")
-    
-    print()
+
+        lines.append(f"{marker}{fid:<6} {feature['title']:<50} {size:<12} {phase_num}")
+
+    lines.append("")
     if current:
-        print(f"Current: {current_id} (Issue #{current[1]})")
-    print()
+        lines.append(f"Current: {current_id} (Issue #{current[1]})")
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_show(feature_id: str):
@@ -192,46 +354,36 @@ def cmd_start(feature_id: str):
     feature = features[feature_id]
     _, repo = get_github()
     
-    # Build issue body
-    body_parts = []
-    
+    # Build issue body in a single growable buffer
+    buf = io.StringIO()
+
     if feature.get("description"):
-        body_parts.append("## Description")
-        body_parts.append(feature["description"].strip())
-        body_parts.append("")
-    
+        buf.write("## Description\n")
+        buf.write(feature["description"].strip())
+        buf.write("\n\n")
+
     if feature.get("acceptance_criteria"):
-        body_parts.append("## Acceptance Criteria")
+        buf.write("## Acceptance Criteria\n")
         for criterion in feature["acceptance_criteria"]:
-            body_parts.append(f"- [ ] {criterion}")
-        body_parts.append("")
-    
+            buf.write(f"- [ ] {criterion}\n")
+        buf.write("\n")
+
     if feature.get("files"):
-        body_parts.append("## Files to Create/Modify")
+        buf.write("## Files to Create/Modify\n")
         for file in feature["files"]:
-            body_parts.append(f"- `{file}`")
-        body_parts.append("")
-    
-    body_parts.append(f"## Prompt")
-    body_parts.append(f"See `tools/prompts/{feature_id}.md`")
-    
-    body = "\n".join(body_parts)
+            buf.write(f"- `{file}`\n")
+        buf.write("\n")
+
+    buf.write("## Prompt\n")
+    buf.write(f"See `tools/prompts/{feature_id}.md`")
+
+    body = buf.getvalue()
     
-    # Get labels
-    labels = []
-    for label_type in ["phase", "component", "size"]:
-        label_name = feature.get(label_type)
-        if label_name:
-            try:
-                label = repo.get_label(label_name)
-                labels.append(label)
-            except:
-                # Create label if it doesn't exist
-                try:
-                    label = repo.create_label(label_name, "0366d6")
-                    labels.append(label)
-                except:
-                    pass
+    # Get labels (one cached label-list fetch instead of per-label probes)
+    labels = _ensure_labels(
+        repo,
+        [feature.get(t) for t in ("phase", "component", "size") if feature.get(t)],
+    )
     
     # Create issue
     title = f"[{feature_id}] {feature['title']}"
@@ -240,8 +392,9 @@ def cmd_start(feature_id: str):
     print(f"\n✅ Created Issue #{issue.number}: {feature['title']}")
     print(f"   {issue.html_url}\n")
     
-    # Track current feature
-    set_current_feature(feature_id, issue.number)
+    # Track current feature, including the GraphQL node id so done can
+    # close the issue without re-fetching it first
+    set_current_feature(feature_id, issue.number, issue.raw_data.get("node_id"))
     
     # Show prompt
     prompt_file = PROMPTS_DIR / f"{feature_id}.md"
@@ -259,6 +412,30 @@ def cmd_start(feature_id: str):
     print(f"{'='*60}\n")
 
 
+def _close_issue_graphql(repo, node_id: str, commit_sha: Optional[str]) -> bool:
+    """Comment (when there is a commit) and close an issue in one mutation.
+
+    Returns False when GraphQL isn't reachable so the caller can fall
+    back to the REST sequence.
+    """
+    variables = {"id": node_id}
+    ops = []
+    if commit_sha:
+        ops.append("addComment(input: {subjectId: $id, body: $body}) { clientMutationId }")
+        variables["body"] = f"Completed in commit {commit_sha}"
+    ops.append("closeIssue(input: {issueId: $id}) { issue { state } }")
+    decl = "($id: ID!, $body: String!)" if commit_sha else "($id: ID!)"
+    mutation = f"mutation {decl} {{ {' '.join(ops)} }}"
+    try:
+        _, data = repo._requester.requestJsonAndCheck(
+            "POST", "/graphql",
+            input={"query": mutation, "variables": variables},
+        )
+        return "errors" not in data
+    except Exception:
+        return False
+
+
 def cmd_done(message: Optional[str] = None):
     """Commit and close current issue"""
     current = get_current_feature()
@@ -266,18 +443,22 @@ def cmd_done(message: Optional[str] = None):
         print("❌ No current feature. Run 'python inquiry.py start <id>' first")
         sys.exit(1)
     
-    feature_id, issue_number = current
-    
+    feature_id, issue_number, node_id = current
+
+    import subprocess
+
     config = load_features()
     feature = config["features"].get(feature_id, {})
-    
-    # Check for uncommitted changes
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True, text=True
-    )
-    
-    if not result.stdout.strip():
+
+    commit_sha = None
+
+    # Stage first, then ask the index whether anything changed — one
+    # worktree scan shared by the check and the commit, instead of a
+    # `git status` pass followed by `git add .` rescanning everything.
+    print("\n📦 Staging changes...")
+    subprocess.run(["git", "add", "-A"])
+
+    if subprocess.run(["git", "diff", "--cached", "--quiet"]).returncode == 0:
         print("⚠️  No changes to commit")
         confirm = input("Close issue anyway? [y/N]: ")
         if confirm.lower() != "y":
@@ -289,36 +470,52 @@ def cmd_done(message: Optional[str] = None):
             component = feature.get("component", "").replace("component:", "")
             title = feature.get("title", feature_id)
             message = f"feat({component}): {title}"
-        
+
         full_message = f"{message}\n\nCloses #{issue_number}"
-        
-        # Git add and commit
-        print("\n📦 Staging changes...")
-        subprocess.run(["git", "add", "."])
-        
+
         print(f"📝 Committing: {message}")
-        subprocess.run(["git", "commit", "-m", full_message])
-        
-        # Get commit SHA
+        # Capture stdout for the SHA but let stderr stream through so
+        # hook rejections and config errors stay visible
         result = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            capture_output=True, text=True
+            ["git", "commit", "-m", full_message],
+            stdout=subprocess.PIPE, text=True
         )
-        commit_sha = result.stdout.strip()
-        
+        sys.stdout.write(result.stdout)
+
+        if result.returncode != 0:
+            print(f"❌ Commit failed — issue #{issue_number} left open")
+            sys.exit(1)
+
+        # The short SHA is already in git commit's summary line
+        # ("[branch abc1234] ..."), so no extra rev-parse is needed.
+        try:
+            commit_sha = result.stdout.split("]", 1)[0].rsplit(None, 1)[-1]
+        except IndexError:
+            commit_sha = subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"],
+                capture_output=True, text=True
+            ).stdout.strip()
+
         # Push
         print("🚀 Pushing...")
         subprocess.run(["git", "push"])
     
-    # Close issue via API (backup in case auto-close doesn't work)
+    # Close issue via API (backup in case auto-close doesn't work).
+    # With the node id cached at start time, the comment and the close
+    # go out as one GraphQL mutation instead of three REST round-trips
+    # (fetch issue, post comment, patch state).
     _, repo = get_github()
-    issue = repo.get_issue(issue_number)
-    
-    if issue.state == "open":
-        if 'commit_sha' in dir():
-            issue.create_comment(f"Completed in commit {commit_sha}")
-        issue.edit(state="closed")
+
+    if node_id and _close_issue_graphql(repo, node_id, commit_sha):
         print(f"✅ Closed Issue #{issue_number}")
+    else:
+        issue = repo.get_issue(issue_number)
+
+        if issue.state == "open":
+            if commit_sha:
+                issue.create_comment(f"Completed in commit {commit_sha}")
+            issue.edit(state="closed")
+            print(f"✅ Closed Issue #{issue_number}")
     
     # Clear current
     clear_current_feature()
@@ -333,8 +530,8 @@ def cmd_abort():
         print("No current feature")
         return
     
-    feature_id, issue_number = current
-    
+    feature_id, issue_number = current[:2]
+
     confirm = input(f"Abandon {feature_id} (Issue #{issue_number})? Issue will remain open. [y/N]: ")
     if confirm.lower() == "y":
         clear_current_feature()
@@ -343,49 +540,76 @@ def cmd_abort():
 
 def cmd_status():
     """Show current status"""
-    current = get_current_feature()
-    
-    if current:
-        feature_id, issue_number = current
-        config = load_features()
-        feature = config["features"].get(feature_id, {})
-        
-        print(f"\n📍 CURRENT: {feature_id}")
-        print(f"   Title: {feature.get('title', 'Unknown')}")
-        print(f"   Issue: #{issue_number}")
-        print(f"\n   Run 'python inquiry.py done' to complete")
-        print(f"   Run 'python inquiry.py abort' to abandon\n")
-    else:
-        print("\n📍 No feature in progress")
-        print("   Run 'python inquiry.py start <id>' to begin\n")
-    
-    # Show git status
-    print("📁 Git Status:")
-    subprocess.run(["git", "status", "--short"])
-    print()
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Kick off the git worktree scan first so it runs while we load and
+    # print the feature info, then splice its output in at the end.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        git_status = executor.submit(
+            subprocess.run,
+            ["git", "status", "--short"],
+            capture_output=True, text=True,
+        )
+
+        current = get_current_feature()
+
+        if current:
+            feature_id, issue_number = current[:2]
+            config = load_features()
+            feature = config["features"].get(feature_id, {})
+
+            print(f"\n📍 CURRENT: {feature_id}")
+            print(f"   Title: {feature.get('title', 'Unknown')}")
+            print(f"   Issue: #{issue_number}")
+            print(f"\n   Run 'python inquiry.py done' to complete")
+            print(f"   Run 'python inquiry.py abort' to abandon\n")
+        else:
+            print("\n📍 No feature in progress")
+            print("   Run 'python inquiry.py start <id>' to begin\n")
+
+        # Show git status
+        print("📁 Git Status:")
+        sys.stdout.write(git_status.result().stdout)
+        print()
 
 
 def cmd_setup_labels():
     """Create all labels in GitHub repo"""
+    global _LABEL_CACHE
     _, repo = get_github()
     config = load_features()
-    
+
     print("\n🏷️  Setting up labels...\n")
-    
+
+    # One GraphQL fetch up-front; the diff against the config happens
+    # locally, so unchanged labels cost no further requests at all.
+    existing = _fetch_labels(repo)
+    if existing is None:
+        existing = {
+            label.name: {"color": label.color,
+                         "description": label.description or ""}
+            for label in repo.get_labels()
+        }
+    _LABEL_CACHE = set(existing)
+
     for category in ["phases", "components", "sizes"]:
         for label_def in config.get("labels", {}).get(category, []):
             name = label_def["name"]
             color = label_def.get("color", "0366d6")
             desc = label_def.get("description", "")
-            
-            try:
-                existing = repo.get_label(name)
-                existing.edit(name=name, color=color, description=desc)
-                print(f"  Updated: {name}")
-            except:
+
+            current = existing.get(name)
+            if current is None:
                 repo.create_label(name=name, color=color, description=desc)
+                _LABEL_CACHE.add(name)
                 print(f"  Created: {name}")
-    
+            elif current["color"].lower() != color.lower() or current["description"] != desc:
+                repo.get_label(name).edit(name=name, color=color, description=desc)
+                print(f"  Updated: {name}")
+            else:
+                print(f"  Unchanged: {name}")
+
     print("\n✅ Labels ready\n")
 
 
@@ -399,22 +623,14 @@ def cmd_create_prompt(feature_id: str):
         sys.exit(1)
     
     feature = features[feature_id]
-    _create_prompt_file(feature_id, feature)
+    _create_prompt_file(feature_id, feature,
+                        prompt_file=PROMPTS_DIR / f"{feature_id}.md")
 
 
-def _create_prompt_file(feature_id: str, feature: dict, overwrite: bool = False):
-    """Internal function to create a prompt file"""
-    prompt_file = PROMPTS_DIR / f"{feature_id}.md"
-    
-    if prompt_file.exists() and not overwrite:
-        print(f"⚠️  Prompt already exists: {prompt_file}")
-        return False
-    
-    # Create prompts directory if needed
-    PROMPTS_DIR.mkdir(exist_ok=True)
-    
-    # Build template
-    content = f"""# PROMPT {feature_id}: {feature['title']}
+# The prompt template is split into fixed blocks at module level; only
+# the bullet lists between them vary per feature, so rendering is a
+# handful of joins instead of repeated string concatenation.
+_PROMPT_HEADER = """# PROMPT {feature_id}: {title}
 
 ## Instructions
 - Create all files directly without asking for confirmation
@@ -424,7 +640,7 @@ def _create_prompt_file(feature_id: str, feature: dict, overwrite: bool = False)
 - Save files to the specified paths
 
 ## Context
-{feature.get('description', 'TODO: Add context').strip()}
+{context}
 
 ## Tech Stack
 - TypeScript 5.4+
@@ -435,18 +651,12 @@ def _create_prompt_file(feature_id: str, feature: dict, overwrite: bool = False)
 
 ### Acceptance Criteria
 """
-    
-    for criterion in feature.get("acceptance_criteria", []):
-        content += f"- {criterion}\n"
-    
-    content += """
+
+_PROMPT_FILES_HEADER = """
 ### Files to Create
 """
-    
-    for file in feature.get("files", []):
-        content += f"- `{file}`\n"
-    
-    content += """
+
+_PROMPT_FOOTER = """
 ## Implementation Details
 
 [Add detailed implementation instructions here]
@@ -456,8 +666,44 @@ def _create_prompt_file(feature_id: str, feature: dict, overwrite: bool = False)
 - [ ] Tests pass
 - [ ] Acceptance criteria met
 """
-    
-    prompt_file.write_text(content)
+
+
+def _prompt_content(feature_id: str, feature: dict) -> str:
+    """Render the prompt markdown for a feature."""
+    parts = [
+        _PROMPT_HEADER.format(
+            feature_id=feature_id,
+            title=feature["title"],
+            context=feature.get("description", "TODO: Add context").strip(),
+        )
+    ]
+    parts.extend(f"- {criterion}\n" for criterion in feature.get("acceptance_criteria", []))
+    parts.append(_PROMPT_FILES_HEADER)
+    parts.extend(f"- `{file}`\n" for file in feature.get("files", []))
+    parts.append(_PROMPT_FOOTER)
+    return "".join(parts)
+
+
+def _create_prompt_file(feature_id: str, feature: dict, overwrite: bool = False,
+                        prompt_file: Optional[Path] = None):
+    """Internal function to create a prompt file.
+
+    Callers that already built the target path pass it in so it isn't
+    derived twice.
+    """
+    if prompt_file is None:
+        prompt_file = PROMPTS_DIR / f"{feature_id}.md"
+
+    if prompt_file.exists() and not overwrite:
+        print(f"⚠️  Prompt already exists: {prompt_file}")
+        return False
+
+    # Create prompts directory if needed
+    PROMPTS_DIR.mkdir(exist_ok=True)
+
+    # Encode once and write bytes — skips the TextIOWrapper and pins
+    # the encoding to UTF-8 regardless of locale.
+    prompt_file.write_bytes(_prompt_content(feature_id, feature).encode("utf-8"))
     print(f"✅ Created: {prompt_file}")
     return True
 
@@ -467,24 +713,44 @@ def cmd_create_all_prompts(overwrite: bool = False):
     config = load_features()
     features = config["features"]
     
+    from concurrent.futures import ThreadPoolExecutor
+
     PROMPTS_DIR.mkdir(exist_ok=True)
-    
-    created = 0
+
     skipped = 0
-    
+
     print(f"\n📝 Creating prompts for {len(features)} features...\n")
-    
+
+    # One directory listing answers every "does it exist yet?" question,
+    # replacing a stat per feature.
+    if overwrite:
+        existing = frozenset()
+    else:
+        with os.scandir(PROMPTS_DIR) as entries:
+            existing = frozenset(e.name for e in entries)
+
+    # Render everything up-front, then hand the independent writes to a
+    # thread pool so the open/write/close syscalls overlap instead of
+    # running back to back.
+    to_write = []
     for feature_id, feature in features.items():
-        prompt_file = PROMPTS_DIR / f"{feature_id}.md"
-        
-        if prompt_file.exists() and not overwrite:
+        name = f"{feature_id}.md"
+
+        if name in existing:
             print(f"   Skipped: {feature_id} (exists)")
             skipped += 1
         else:
-            _create_prompt_file(feature_id, feature, overwrite)
-            created += 1
-    
-    print(f"\n✅ Done: {created} created, {skipped} skipped")
+            to_write.append((PROMPTS_DIR / name,
+                             _prompt_content(feature_id, feature).encode("utf-8")))
+
+    if to_write:
+        with ThreadPoolExecutor(max_workers=min(16, len(to_write))) as executor:
+            for _ in executor.map(lambda item: item[0].write_bytes(item[1]), to_write):
+                pass
+        for prompt_file, _ in to_write:
+            print(f"✅ Created: {prompt_file}")
+
+    print(f"\n✅ Done: {len(to_write)} created, {skipped} skipped")
     if skipped > 0 and not overwrite:
         print(f"   Run with --overwrite to replace existing prompts")
 
@@ -493,59 +759,53 @@ def cmd_create_all_prompts(overwrite: bool = False):
 # Main
 # ============================================
 
+def _run_list():
+    phase = None
+    for arg in sys.argv[2:]:
+        if arg.startswith("--phase="):
+            phase = arg.split("=")[1]
+    cmd_list(phase)
+
+
+def _run_with_feature_id(cmd, name):
+    if len(sys.argv) < 3:
+        print(f"Usage: python inquiry.py {name} <feature_id>")
+        sys.exit(1)
+    cmd(sys.argv[2])
+
+
+def _run_done():
+    message = " ".join(sys.argv[2:]) if len(sys.argv) > 2 else None
+    cmd_done(message)
+
+
+# Command dispatch table — one dict lookup instead of an elif chain
+COMMANDS = {
+    "list": _run_list,
+    "show": lambda: _run_with_feature_id(cmd_show, "show"),
+    "start": lambda: _run_with_feature_id(cmd_start, "start"),
+    "done": _run_done,
+    "abort": cmd_abort,
+    "status": cmd_status,
+    "setup-labels": cmd_setup_labels,
+    "create-prompt": lambda: _run_with_feature_id(cmd_create_prompt, "create-prompt"),
+    "create-all-prompts": lambda: cmd_create_all_prompts("--overwrite" in sys.argv),
+}
+
+
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
         sys.exit(1)
-    
+
     command = sys.argv[1]
-    
-    if command == "list":
-        phase = None
-        for arg in sys.argv[2:]:
-            if arg.startswith("--phase="):
-                phase = arg.split("=")[1]
-        cmd_list(phase)
-    
-    elif command == "show":
-        if len(sys.argv) < 3:
-            print("Usage: python inquiry.py show <feature_id>")
-            sys.exit(1)
-        cmd_show(sys.argv[2])
-    
-    elif command == "start":
-        if len(sys.argv) < 3:
-            print("Usage: python inquiry.py start <feature_id>")
-            sys.exit(1)
-        cmd_start(sys.argv[2])
-    
-    elif command == "done":
-        message = " ".join(sys.argv[2:]) if len(sys.argv) > 2 else None
-        cmd_done(message)
-    
-    elif command == "abort":
-        cmd_abort()
-    
-    elif command == "status":
-        cmd_status()
-    
-    elif command == "setup-labels":
-        cmd_setup_labels()
-    
-    elif command == "create-prompt":
-        if len(sys.argv) < 3:
-            print("Usage: python inquiry.py create-prompt <feature_id>")
-            sys.exit(1)
-        cmd_create_prompt(sys.argv[2])
-    
-    elif command == "create-all-prompts":
-        overwrite = "--overwrite" in sys.argv
-        cmd_create_all_prompts(overwrite)
-    
-    else:
+
+    handler = COMMANDS.get(command)
+    if handler is None:
         print(f"Unknown command: {command}")
-        print("Commands: list, show, start, done, abort, status, setup-labels, create-prompt, create-all-prompts")
+        print(f"Commands: {', '.join(COMMANDS)}")
         sys.exit(1)
+    handler()
 
 
 if __name__ == "__main__":
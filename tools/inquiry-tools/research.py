@@ -18,16 +18,40 @@ Usage:
 """
 
 import os
+import re
 import sys
+import time
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime, date
+from string import Template
+
+# datetime is imported lazily inside today(): only the cmd_new_*
+# commands date-stamp documents, so list/status don't pay for it
 
 # ============================================
 # Configuration
 # ============================================
 
-# Find repo root (look for .git folder)
+# Find repo root. INQUIRY_REPO_ROOT short-circuits everything (and lets
+# wrapper scripts pass the answer down instead of re-discovering it);
+# otherwise ask git directly — one process instead of a stat per parent
+# directory — and only fall back to walking up when git isn't available.
 def find_repo_root():
+    env_root = os.environ.get("INQUIRY_REPO_ROOT")
+    if env_root:
+        return Path(env_root)
+
+    import subprocess
+    try:
+        top = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True, text=True,
+        ).stdout.strip()
+        if top:
+            return Path(top)
+    except OSError:
+        pass
+
     current = Path.cwd()
     while current != current.parent:
         if (current / ".git").exists():
@@ -36,20 +60,35 @@ def find_repo_root():
     return Path.cwd()
 
 REPO_ROOT = find_repo_root()
+# Child invocations of these tools inherit the answer
+os.environ.setdefault("INQUIRY_REPO_ROOT", str(REPO_ROOT))
 RESEARCH_DIR = REPO_ROOT / "research"
 
+# Display-only repo-relative paths: a constant-time string slice
+# instead of Path.relative_to's per-call part splitting. Paths that
+# aren't under the repo root (never the case for RESEARCH_DIR) would
+# just print absolute.
+_REPO_PREFIX = str(REPO_ROOT) + os.sep
+
+
+def _rel(path) -> str:
+    return str(path).removeprefix(_REPO_PREFIX)
+
 # ============================================
 # Templates
 # ============================================
 
+# Document templates, compiled once at import into string.Template
+# objects (see below) so bulk creation doesn't re-parse the format
+# string per document. Literal "$schema" keys are escaped as $$schema.
 TEMPLATES = {
-    "domain": '''# Research: {title}
+    "domain": '''# Research: ${title}
 
 ## Metadata
-- **Date**: {date}
+- **Date**: ${date}
 - **Status**: Draft
 - **Author**: 
-- **Tags**: {tags}
+- **Tags**: ${tags}
 
 ## Objective
 [What are we trying to learn?]
@@ -100,13 +139,13 @@ TEMPLATES = {
 2. Reference 2
 ''',
 
-    "spec": '''# Agent Specification: {agent_name}
+    "spec": '''# Agent Specification: ${agent_name}
 
 ## Metadata
 - **Version**: 0.1.0
 - **Status**: Draft
 - **Author**: 
-- **Date**: {date}
+- **Date**: ${date}
 
 ## Overview
 
@@ -124,38 +163,38 @@ TEMPLATES = {
 
 ### Input Schema
 ```typescript
-interface {agent_name}Input {{
+interface ${agent_name}Input {
   // Define input fields
-}}
+}
 ```
 
 ```json
-{{
-  "$schema": "http://json-schema.org/draft-07/schema#",
+{
+  "$$schema": "http://json-schema.org/draft-07/schema#",
   "type": "object",
-  "properties": {{
+  "properties": {
     
-  }},
+  },
   "required": []
-}}
+}
 ```
 
 ### Output Schema
 ```typescript
-interface {agent_name}Output {{
+interface ${agent_name}Output {
   // Define output fields
-}}
+}
 ```
 
 ```json
-{{
-  "$schema": "http://json-schema.org/draft-07/schema#",
+{
+  "$$schema": "http://json-schema.org/draft-07/schema#",
   "type": "object",
-  "properties": {{
+  "properties": {
     
-  }},
+  },
   "required": []
-}}
+}
 ```
 
 ## Business Rules
@@ -185,7 +224,7 @@ interface {agent_name}Output {{
 
 ### Prompt Template
 ```
-[Template with {{variables}}]
+[Template with {variables}]
 ```
 
 ### Response Parsing
@@ -204,11 +243,11 @@ interface {agent_name}Output {{
 ### TC-001: [Basic case]
 - **Input**: 
 ```json
-{{}}
+{}
 ```
 - **Expected Output**:
 ```json
-{{}}
+{}
 ```
 - **Status**: Pending
 
@@ -239,15 +278,15 @@ interface {agent_name}Output {{
 
 | Version | Date | Changes |
 |---------|------|---------|
-| 0.1.0 | {date} | Initial draft |
+| 0.1.0 | ${date} | Initial draft |
 ''',
 
-    "eval": '''# Agent Evaluation: {agent_name} v{version}
+    "eval": '''# Agent Evaluation: ${agent_name} v${version}
 
 ## Metadata
-- **Agent**: {agent_name}
-- **Version**: {version}
-- **Evaluation Date**: {date}
+- **Agent**: ${agent_name}
+- **Version**: ${version}
+- **Evaluation Date**: ${date}
 - **Evaluator**: 
 - **Status**: In Progress
 
@@ -354,11 +393,11 @@ interface {agent_name}Output {{
 - [ ] Approved for: [Production / Further Testing / Rework]
 ''',
 
-    "pilot": '''# Pilot: {agency_name}
+    "pilot": '''# Pilot: ${agency_name}
 
 ## Overview
-- **Agency**: {agency_name}
-- **Start Date**: {date}
+- **Agency**: ${agency_name}
+- **Start Date**: ${date}
 - **Status**: Onboarding
 - **Primary Contact**: 
 - **Technical Contact**: 
@@ -414,10 +453,10 @@ interface {agent_name}Output {{
 [General notes about this pilot]
 ''',
 
-    "interview": '''# Interview: {agency_name}
+    "interview": '''# Interview: ${agency_name}
 
 ## Metadata
-- **Date**: {date}
+- **Date**: ${date}
 - **Time**: 
 - **Duration**: 
 - **Attendees**: 
@@ -471,10 +510,10 @@ interface {agent_name}Output {{
 - Implication 2
 ''',
 
-    "finding": '''# Finding: {title}
+    "finding": '''# Finding: ${title}
 
 ## Metadata
-- **Date**: {date}
+- **Date**: ${date}
 - **Source**: [Interview / Document / Observation / Analysis]
 - **Confidence**: [High / Medium / Low]
 - **Tags**: 
@@ -520,6 +559,8 @@ interface {agent_name}Output {{
 '''
 }
 
+TEMPLATES = {key: Template(text) for key, text in TEMPLATES.items()}
+
 # Folder structure for init
 FOLDER_STRUCTURE = {
     "domains": {
@@ -542,6 +583,84 @@ FOLDER_STRUCTURE = {
 }
 
 
+# The research/README.md contents, encoded once at import so init
+# writes the bytes straight out without a per-call encode
+_README_BYTES = ('''# Research
+
+This folder contains all research documentation for the Inquiry Framework.
+
+## Structure
+
+```
+research/
+├── domains/           # Domain research
+│   ├── claim-categories/
+│   ├── brief-types/
+│   ├── agency-workflow/
+│   └── sources/
+├── agents/            # Agent specifications and evaluations
+│   ├── specifications/
+│   ├── test-cases/
+│   └── evaluations/
+├── pilots/            # Pilot agency documentation
+├── knowledge-base/    # Reference materials
+│   ├── ftc/
+│   └── regulations/
+└── findings/          # Individual research findings
+```
+
+## Managing Research
+
+Use the research management script:
+
+```bash
+python tools/inquiry-tools/research.py new domain "FTC claim categories"
+python tools/inquiry-tools/research.py new spec ClaimExtraction
+python tools/inquiry-tools/research.py new pilot "Agency A"
+```
+
+See `python tools/inquiry-tools/research.py --help` for all commands.
+''').encode("utf-8")
+
+
+# Fixed sample test case written by `new spec`; kept as bytes so the
+# write skips encoding and the text layer entirely
+_SAMPLE_TC001 = b'''{
+  "id": "TC-001",
+  "name": "Basic test case",
+  "description": "",
+  "input": {
+    
+  },
+  "expectedOutput": {
+    
+  },
+  "tags": ["basic"]
+}
+'''
+
+# Keyword routing for cmd_new_domain: token -> (priority, subfolder
+# under domains/). Tokens are matched exactly (common plural forms are
+# listed alongside), replacing five sequential substring scans of the
+# slug; when a topic hits several groups the lowest priority wins,
+# preserving the old branch order.
+_DOMAIN_ROUTE = {}
+for _prio, (_keywords, _subfolder) in enumerate([
+    (("ftc", "claim", "claims", "category", "categories", "substantiation"),
+     ("claim-categories",)),
+    (("brief", "briefs", "deliverable", "deliverables", "type", "types"),
+     ("brief-types",)),
+    (("workflow", "workflows", "agency", "agencies", "process", "processes"),
+     ("agency-workflow",)),
+    (("source", "sources", "credibility"),
+     ("sources",)),
+    (("health", "financial", "cpg", "food", "environment", "environmental"),
+     ("claim-categories", "industry-specific")),
+]):
+    for _kw in _keywords:
+        _DOMAIN_ROUTE.setdefault(_kw, (_prio, _subfolder))
+
+
 # ============================================
 # Helper Functions
 # ============================================
@@ -559,20 +678,49 @@ def create_file(path: Path, content: str, overwrite: bool = False):
     
     ensure_dir(path.parent)
     path.write_text(content)
-    print(f"✅ Created: {path.relative_to(REPO_ROOT)}")
+    print(f"✅ Created: {_rel(path)}")
     return True
 
 
+# Compiled once at module scope so slugify doesn't go through the
+# regex-cache lookup on every cmd_new_* call
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
 def slugify(text: str) -> str:
     """Convert text to slug"""
-    return text.lower().replace(" ", "-").replace("_", "-")
+    return _SLUG_RE.sub("-", text.lower()).strip("-")
 
 
-def today() -> str:
-    """Return today's date as string"""
+@lru_cache(maxsize=1)
+def _today_cached(_minute: int) -> str:
+    # _minute only serves as the cache key; crossing a minute boundary
+    # (and hence, eventually, midnight) produces a fresh date string.
+    from datetime import date
+
     return date.today().isoformat()
 
 
+_AGENT_TRANS = str.maketrans("-_", "  ")
+
+
+def _norm_agent(agent_name: str) -> tuple:
+    """CamelCase display name and slug, from one spaced intermediate.
+
+    Shared by `new spec` and `new eval`, which previously both ran
+    their own replace/title/slugify chains over the same input.
+    """
+    spaced = agent_name.translate(_AGENT_TRANS)
+    name = spaced.title().replace(" ", "")
+    slug = _SLUG_RE.sub("-", spaced.lower()).strip("-")
+    return name, slug
+
+
+def today() -> str:
+    """Return today's date as string (cached per minute)"""
+    return _today_cached(int(time.time()) // 60)
+
+
 # ============================================
 # Commands
 # ============================================
@@ -581,92 +729,51 @@ def cmd_init():
     """Initialize research folder structure"""
     print(f"\n📁 Initializing research structure in {REPO_ROOT}\n")
     
-    def create_structure(base: Path, structure: dict):
+    # Flatten the tree into folder paths without touching the
+    # filesystem, then make one mkdir and one idempotent .gitkeep touch
+    # per folder — the old version probed each directory's contents with
+    # iterdir (twice) just to decide whether to touch the keep file.
+    def _flatten(base: Path, structure: dict, out: list):
         for name, children in structure.items():
             folder = base / name
-            ensure_dir(folder)
-            print(f"  Created: {folder.relative_to(REPO_ROOT)}/")
-            
-            # Create .gitkeep for empty folders
-            gitkeep = folder / ".gitkeep"
-            if not any(folder.iterdir()) or (len(list(folder.iterdir())) == 1 and gitkeep.exists()):
-                gitkeep.touch()
-            
+            out.append(folder)
             if isinstance(children, dict):
-                create_structure(folder, children)
+                _flatten(folder, children, out)
             elif isinstance(children, list):
-                for child in children:
-                    child_folder = folder / child
-                    ensure_dir(child_folder)
-                    print(f"  Created: {child_folder.relative_to(REPO_ROOT)}/")
-                    (child_folder / ".gitkeep").touch()
-    
-    create_structure(RESEARCH_DIR, FOLDER_STRUCTURE)
-    
-    # Create README
-    readme_content = '''# Research
-
-This folder contains all research documentation for the Inquiry Framework.
-
-## Structure
+                out.extend(folder / child for child in children)
 
-```
-research/
-├── domains/           # Domain research
-│   ├── claim-categories/
-│   ├── brief-types/
-│   ├── agency-workflow/
-│   └── sources/
-├── agents/            # Agent specifications and evaluations
-│   ├── specifications/
-│   ├── test-cases/
-│   └── evaluations/
-├── pilots/            # Pilot agency documentation
-├── knowledge-base/    # Reference materials
-│   ├── ftc/
-│   └── regulations/
-└── findings/          # Individual research findings
-```
-
-## Managing Research
-
-Use the research management script:
+    folders = []
+    _flatten(RESEARCH_DIR, FOLDER_STRUCTURE, folders)
 
-```bash
-python tools/inquiry-tools/research.py new domain "FTC claim categories"
-python tools/inquiry-tools/research.py new spec ClaimExtraction
-python tools/inquiry-tools/research.py new pilot "Agency A"
-```
+    for folder in folders:
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / ".gitkeep").touch(exist_ok=True)
+        print(f"  Created: {_rel(folder)}/")
+    
+    # Create README (always overwritten; see _README_BYTES)
+    (RESEARCH_DIR / "README.md").write_bytes(_README_BYTES)
+    print(f"✅ Created: {_rel(RESEARCH_DIR / 'README.md')}")
 
-See `python tools/inquiry-tools/research.py --help` for all commands.
-'''
-    create_file(RESEARCH_DIR / "README.md", readme_content, overwrite=True)
     
-    print(f"\n✅ Research structure initialized\n")
+    print("\n✅ Research structure initialized\n")
 
 
 def cmd_new_domain(topic: str):
     """Create new domain research document"""
     slug = slugify(topic)
     
-    # Determine folder based on topic keywords
-    if any(kw in slug for kw in ["ftc", "claim", "category", "substantiation"]):
-        folder = RESEARCH_DIR / "domains" / "claim-categories"
-    elif any(kw in slug for kw in ["brief", "deliverable", "type"]):
-        folder = RESEARCH_DIR / "domains" / "brief-types"
-    elif any(kw in slug for kw in ["workflow", "agency", "process"]):
-        folder = RESEARCH_DIR / "domains" / "agency-workflow"
-    elif any(kw in slug for kw in ["source", "credibility"]):
-        folder = RESEARCH_DIR / "domains" / "sources"
-    elif any(kw in slug for kw in ["health", "financial", "cpg", "food", "environment"]):
-        folder = RESEARCH_DIR / "domains" / "claim-categories" / "industry-specific"
+    # Determine folder based on topic keywords — one pass over the
+    # slug's tokens with a dict lookup each (see _DOMAIN_ROUTE)
+    matches = [_DOMAIN_ROUTE[t] for t in slug.split("-") if t in _DOMAIN_ROUTE]
+    if matches:
+        folder = RESEARCH_DIR.joinpath("domains", *min(matches)[1])
     else:
         folder = RESEARCH_DIR / "domains"
     
     filename = f"{slug}.md"
     filepath = folder / filename
     
-    content = TEMPLATES["domain"].format(
+    content = TEMPLATES["domain"].substitute(
         title=topic,
         date=today(),
         tags=slug.replace("-", ", ")
@@ -677,14 +784,12 @@ def cmd_new_domain(topic: str):
 
 def cmd_new_spec(agent_name: str):
     """Create new agent specification"""
-    # Normalize agent name
-    name = agent_name.replace("-", " ").replace("_", " ").title().replace(" ", "")
-    slug = slugify(agent_name)
-    
+    name, slug = _norm_agent(agent_name)
+
     folder = RESEARCH_DIR / "agents" / "specifications"
     filepath = folder / f"{slug}-spec.md"
     
-    content = TEMPLATES["spec"].format(
+    content = TEMPLATES["spec"].substitute(
         agent_name=name,
         date=today()
     )
@@ -694,36 +799,26 @@ def cmd_new_spec(agent_name: str):
     # Also create test-cases folder
     test_folder = RESEARCH_DIR / "agents" / "test-cases" / slug
     ensure_dir(test_folder)
-    print(f"✅ Created: {test_folder.relative_to(REPO_ROOT)}/")
+    print(f"✅ Created: {_rel(test_folder)}/")
     
     # Create sample test case file
     sample_test = test_folder / "TC-001.json"
-    sample_content = '''{
-  "id": "TC-001",
-  "name": "Basic test case",
-  "description": "",
-  "input": {
-    
-  },
-  "expectedOutput": {
-    
-  },
-  "tags": ["basic"]
-}
-'''
-    create_file(sample_test, sample_content)
+    if sample_test.exists():
+        print(f"⚠️  File exists: {sample_test}")
+    else:
+        sample_test.write_bytes(_SAMPLE_TC001)
+        print(f"✅ Created: {_rel(sample_test)}")
 
 
 def cmd_new_eval(agent_name: str, version: str):
     """Create new agent evaluation document"""
-    name = agent_name.replace("-", " ").replace("_", " ").title().replace(" ", "")
-    slug = slugify(agent_name)
-    
+    name, slug = _norm_agent(agent_name)
+
     folder = RESEARCH_DIR / "agents" / "evaluations"
     filename = f"{today()}-{slug}-v{version.replace('.', '-')}.md"
     filepath = folder / filename
     
-    content = TEMPLATES["eval"].format(
+    content = TEMPLATES["eval"].substitute(
         agent_name=name,
         version=version,
         date=today()
@@ -737,20 +832,21 @@ def cmd_new_pilot(agency_name: str):
     slug = slugify(agency_name)
     
     folder = RESEARCH_DIR / "pilots" / slug
-    ensure_dir(folder)
-    ensure_dir(folder / "briefs")
-    ensure_dir(folder / "feedback")
+    # The two subfolder makedirs create `folder` on the way, so no
+    # separate mkdir for it
+    os.makedirs(folder / "briefs", exist_ok=True)
+    os.makedirs(folder / "feedback", exist_ok=True)
     
     # Create main pilot doc
     filepath = folder / "README.md"
-    content = TEMPLATES["pilot"].format(
+    content = TEMPLATES["pilot"].substitute(
         agency_name=agency_name,
         date=today()
     )
     create_file(filepath, content)
     
-    print(f"✅ Created: {folder.relative_to(REPO_ROOT)}/briefs/")
-    print(f"✅ Created: {folder.relative_to(REPO_ROOT)}/feedback/")
+    print(f"✅ Created: {_rel(folder)}/briefs/")
+    print(f"✅ Created: {_rel(folder)}/feedback/")
 
 
 def cmd_new_interview(agency_name: str):
@@ -763,7 +859,7 @@ def cmd_new_interview(agency_name: str):
     filename = f"{today()}-interview.md"
     filepath = folder / filename
     
-    content = TEMPLATES["interview"].format(
+    content = TEMPLATES["interview"].substitute(
         agency_name=agency_name,
         date=today()
     )
@@ -779,7 +875,7 @@ def cmd_new_finding(topic: str):
     filename = f"{today()}-{slug}.md"
     filepath = folder / filename
     
-    content = TEMPLATES["finding"].format(
+    content = TEMPLATES["finding"].substitute(
         title=topic,
         date=today()
     )
@@ -789,27 +885,50 @@ def cmd_new_finding(topic: str):
 
 def cmd_list(doc_type: str = None):
     """List research documents"""
-    print(f"\n📚 Research Documents\n")
+    print("\n📚 Research Documents\n")
     
-    if not RESEARCH_DIR.exists():
+    # One is_dir() up front is the only existence probe; the walkers
+    # below trust the path and let scandir/walk handle disappearing
+    # subfolders.
+    if not RESEARCH_DIR.is_dir():
         print("❌ Research folder not found. Run 'python research.py init' first.")
         return
     
-    def list_files(folder: Path, indent: int = 0):
-        if not folder.exists():
-            return
-        
-        for item in sorted(folder.iterdir()):
-            if item.name.startswith("."):
+    # os.scandir reuses the file type from the directory read, so no
+    # per-entry stat or Path object is needed the way iterdir does it.
+    # An explicit stack replaces one Python call frame per directory;
+    # each directory's entries are pushed in reverse-sorted order so
+    # they pop — and print — in sorted order, matching the old
+    # recursive output. Stack items are either a ready row (str) or a
+    # (path, child_indent, name) directory still to be expanded.
+    def walk_rows(root):
+        stack = [(root, 0, None)]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):
+                yield item
                 continue
-            
+
+            path, indent, name = item
+            if name is not None:
+                yield f"{'  ' * (indent - 1)}📁 {name}/"
+
+            try:
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda e: e.name, reverse=True)
+            except FileNotFoundError:
+                continue
+
             prefix = "  " * indent
-            if item.is_dir():
-                print(f"{prefix}📁 {item.name}/")
-                list_files(item, indent + 1)
-            elif item.suffix == ".md":
-                print(f"{prefix}📄 {item.name}")
-    
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, indent + 1, entry.name))
+                elif entry.name.endswith(".md"):
+                    stack.append(f"{prefix}📄 {entry.name}")
+
+    out = []
     if doc_type:
         type_map = {
             "domain": RESEARCH_DIR / "domains",
@@ -820,37 +939,73 @@ def cmd_list(doc_type: str = None):
         }
         folder = type_map.get(doc_type)
         if folder:
-            list_files(folder)
+            out.extend(walk_rows(folder))
         else:
-            print(f"Unknown type: {doc_type}")
-            print("Types: domain, spec, eval, pilot, finding")
+            out.append(f"Unknown type: {doc_type}")
+            out.append("Types: domain, spec, eval, pilot, finding")
     else:
-        list_files(RESEARCH_DIR)
-    
-    print()
+        out.extend(walk_rows(RESEARCH_DIR))
+
+    out.append("")
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 def cmd_status():
     """Show research status"""
-    print(f"\n📊 Research Status\n")
+    print("\n📊 Research Status\n")
     
-    if not RESEARCH_DIR.exists():
+    # One is_dir() up front is the only existence probe; the walkers
+    # below trust the path and let scandir/walk handle disappearing
+    # subfolders.
+    if not RESEARCH_DIR.is_dir():
         print("❌ Research folder not found. Run 'python research.py init' first.")
         return
     
-    def count_files(folder: Path, extension: str = ".md") -> int:
-        if not folder.exists():
-            return 0
-        return len([f for f in folder.rglob(f"*{extension}") if not f.name.startswith(".")])
-    
     stats = {
-        "Domain Research": count_files(RESEARCH_DIR / "domains"),
-        "Agent Specs": count_files(RESEARCH_DIR / "agents" / "specifications"),
-        "Agent Evaluations": count_files(RESEARCH_DIR / "agents" / "evaluations"),
-        "Test Cases": count_files(RESEARCH_DIR / "agents" / "test-cases", ".json"),
-        "Pilots": len([d for d in (RESEARCH_DIR / "pilots").iterdir() if d.is_dir()]) if (RESEARCH_DIR / "pilots").exists() else 0,
-        "Findings": count_files(RESEARCH_DIR / "findings"),
+        "Domain Research": 0,
+        "Agent Specs": 0,
+        "Agent Evaluations": 0,
+        "Test Cases": 0,
+        "Pilots": 0,
+        "Findings": 0,
     }
+
+    # Which (stat key, extension) a directory's files count towards,
+    # decided from the first two components of its relative path
+    def _classify(parts):
+        top = parts[0]
+        if top == "domains":
+            return "Domain Research", ".md"
+        if top == "agents" and len(parts) > 1:
+            return {
+                "specifications": ("Agent Specs", ".md"),
+                "evaluations": ("Agent Evaluations", ".md"),
+                "test-cases": ("Test Cases", ".json"),
+            }.get(parts[1])
+        if top == "findings":
+            return "Findings", ".md"
+        return None
+
+    research_root = str(RESEARCH_DIR)
+    prefix_len = len(research_root) + 1
+    pilots_dir = os.path.join(research_root, "pilots")
+
+    # One walk over the whole tree feeds every counter, instead of six
+    # separate recursive scans over overlapping subtrees
+    for root, dirs, files in os.walk(research_root):
+        if root == pilots_dir:
+            stats["Pilots"] = len(dirs)
+
+        parts = root[prefix_len:].split(os.sep)
+        if not parts[0]:
+            continue
+        classified = _classify(parts)
+        if classified is None:
+            continue
+        key, ext = classified
+        stats[key] += sum(
+            1 for f in files if f.endswith(ext) and not f.startswith(".")
+        )
     
     for category, count in stats.items():
         bar = "█" * min(count, 20)
@@ -863,58 +1018,65 @@ def cmd_status():
 # Main
 # ============================================
 
+# `new` subtypes: handler and how many positional args it takes
+_NEW_CMDS = {
+    "domain": (cmd_new_domain, 1),
+    "spec": (cmd_new_spec, 1),
+    "eval": (cmd_new_eval, 2),
+    "pilot": (cmd_new_pilot, 1),
+    "interview": (cmd_new_interview, 1),
+    "finding": (cmd_new_finding, 1),
+}
+
+
+def _run_new():
+    if len(sys.argv) < 4:
+        print("Usage: python research.py new <type> <name>")
+        print("Types: domain, spec, eval, pilot, interview, finding")
+        sys.exit(1)
+
+    doc_type = sys.argv[2]
+    entry = _NEW_CMDS.get(doc_type)
+    if entry is None:
+        print(f"Unknown type: {doc_type}")
+        print(f"Types: {', '.join(_NEW_CMDS)}")
+        sys.exit(1)
+
+    fn, argc = entry
+    args = sys.argv[3:3 + argc]
+    if len(args) < argc:
+        print("Usage: python research.py new eval <agent> <version>")
+        sys.exit(1)
+    fn(*args)
+
+
+def _show_help():
+    print(__doc__)
+
+
+# Command dispatch table — one dict lookup instead of an elif chain
+_CMDS = {
+    "init": cmd_init,
+    "new": _run_new,
+    "list": lambda: cmd_list(sys.argv[2] if len(sys.argv) > 2 else None),
+    "status": cmd_status,
+    "-h": _show_help,
+    "--help": _show_help,
+    "help": _show_help,
+}
+
+
 def main():
     if len(sys.argv) < 2:
         print(__doc__)
         sys.exit(1)
-    
-    command = sys.argv[1]
-    
-    if command == "init":
-        cmd_init()
-    
-    elif command == "new":
-        if len(sys.argv) < 4:
-            print("Usage: python research.py new <type> <name>")
-            print("Types: domain, spec, eval, pilot, interview, finding")
-            sys.exit(1)
-        
-        doc_type = sys.argv[2]
-        
-        if doc_type == "domain":
-            cmd_new_domain(sys.argv[3])
-        elif doc_type == "spec":
-            cmd_new_spec(sys.argv[3])
-        elif doc_type == "eval":
-            if len(sys.argv) < 5:
-                print("Usage: python research.py new eval <agent> <version>")
-                sys.exit(1)
-            cmd_new_eval(sys.argv[3], sys.argv[4])
-        elif doc_type == "pilot":
-            cmd_new_pilot(sys.argv[3])
-        elif doc_type == "interview":
-            cmd_new_interview(sys.argv[3])
-        elif doc_type == "finding":
-            cmd_new_finding(sys.argv[3])
-        else:
-            print(f"Unknown type: {doc_type}")
-            print("Types: domain, spec, eval, pilot, interview, finding")
-            sys.exit(1)
-    
-    elif command == "list":
-        doc_type = sys.argv[2] if len(sys.argv) > 2 else None
-        cmd_list(doc_type)
-    
-    elif command == "status":
-        cmd_status()
-    
-    elif command in ["-h", "--help", "help"]:
-        print(__doc__)
-    
-    else:
-        print(f"Unknown command: {command}")
+
+    handler = _CMDS.get(sys.argv[1])
+    if handler is None:
+        print(f"Unknown command: {sys.argv[1]}")
         print("Commands: init, new, list, status")
         sys.exit(1)
+    handler()
 
 
 if __name__ == "__main__":